@@ -0,0 +1,33 @@
+import sys
+
+from xkb import render, render_row
+
+
+class Corpus:
+    # Layouts converted together, sharing identical keys and the rendering of
+    # their rows, as related layouts mostly have the same rows. Whole layouts
+    # and texts are not kept, as their names and descriptions differ.
+    def __init__(self):
+        self.keys = {}
+        self.rows = {}
+
+    def intern(self, layout):
+        keys = {}
+
+        for name, key in layout.keys.items():
+            content = tuple(key)
+            key = self.keys.setdefault(content, key)
+            keys[sys.intern(name)] = key
+
+        return layout._replace(keys=keys)
+
+    def row(self, key, widths):
+        # Only interned keys, which the corpus keeps alive, are rendered here
+        # so that their identity stands for their content
+        cache = (id(key), widths)
+        if cache not in self.rows:
+            self.rows[cache] = render_row(key, widths)
+        return self.rows[cache]
+
+    def render(self, layout, align=True):
+        return render(self.intern(layout), align, self.row)
@@ -0,0 +1,352 @@
+import importlib.util
+import functools
+import json
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from collections import namedtuple
+
+import keysym
+import timing
+import transforms
+
+# Exceptions raised by convert() for unreadable or unsupported layouts
+ERRORS = (OSError, ET.ParseError, KeyError, TypeError, ValueError)
+
+# XKB key names of the ISO/IEC 9995-1 positions. The keys of the
+# alphanumeric section are named after their row and column, up to the last
+# column of each row, the function keys after their number, and the keys of
+# the numeric section (columns 51 to 54) and the rest after what they are.
+ROWS = {'E': ('AE', 13), 'D': ('AD', 12), 'C': ('AC', 12), 'B': ('AB', 11)}
+
+NAMED_KEYS = {
+    'E00': 'TLDE',
+    'D13': 'BKSL',
+    'B00': 'LSGT',
+    'A03': 'SPCE',
+    'K00': 'ESC',
+    'E51': 'NMLK',
+    'E52': 'KPDV',
+    'E53': 'KPMU',
+    'E54': 'KPSU',
+    'D51': 'KP7',
+    'D52': 'KP8',
+    'D53': 'KP9',
+    'D54': 'KPAD',
+    'C51': 'KP4',
+    'C52': 'KP5',
+    'C53': 'KP6',
+    'B51': 'KP1',
+    'B52': 'KP2',
+    'B53': 'KP3',
+    'B54': 'KPEN',
+    'A51': 'KP0',
+    'A53': 'KPDL',
+}
+
+
+def key_names():
+    names = {}
+    for row, (prefix, columns) in ROWS.items():
+        for column in range(1, columns + 1):
+            names[f'{row}{column:02}'] = f'{prefix}{column:02}'
+    for number in range(1, 13):
+        names[f'K{number:02}'] = f'FK{number:02}'
+    names.update(NAMED_KEYS)
+    return names
+
+
+# Updated by load_geometry() with the positions of a geometry file
+KEY_NAMES = key_names()
+
+
+def load_geometry(path):
+    # Reads a JSON object mapping ISO positions to XKB key names, or to null
+    # for positions to leave out, over the default ones
+    with open(path, encoding='utf-8') as f:
+        geometry = json.load(f)
+    if not isinstance(geometry, dict) or not all(
+        isinstance(name, (str, type(None))) for name in geometry.values()
+    ):
+        raise ValueError(f'{path}: expected an object of key names')
+    for iso, name in geometry.items():
+        if name is None:
+            KEY_NAMES.pop(iso, None)
+        else:
+            KEY_NAMES[iso] = name
+
+
+def version():
+    import hashlib
+
+    # Identifies the output of the converter along with the keysym tables
+    digest = hashlib.sha256(keysym.digest.encode())
+    for module in ('keysym', 'ldml', 'transforms', 'xkb'):
+        with open(importlib.util.find_spec(module).origin, 'rb') as f:
+            digest.update(f.read())
+    digest.update(json.dumps(KEY_NAMES, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+SHIFT, CAPS, ALT, ALT_LEFT, CTRL, CMD = (1 << i for i in range(6))
+
+# Modifier bits of the modifier keys of LDML. Right alt is the level three
+# switch of the output, so only layouts that need left alt alone are dropped.
+MODIFIERS = {
+    'shift': SHIFT,
+    'shiftL': SHIFT,
+    'shiftR': SHIFT,
+    'caps': CAPS,
+    'alt': ALT,
+    'altR': ALT,
+    'opt': ALT,
+    'optR': ALT,
+    'altL': ALT_LEFT,
+    'optL': ALT_LEFT,
+    'ctrl': CTRL,
+    'ctrlL': CTRL,
+    'ctrlR': CTRL,
+    'cmd': CMD,
+}
+
+# Levels of the FOUR_LEVEL_PLUS_LOCK type by modifier state, with ctrl+alt
+# standing for AltGr as on Windows. Caps lock combined with other modifiers
+# selects the same level as without it, so it has no level of its own.
+LEVELS = {
+    0: 1,
+    SHIFT: 2,
+    ALT: 3,
+    ALT | SHIFT: 4,
+    CAPS: 5,
+    CTRL | ALT: 3,
+    CTRL | ALT | SHIFT: 4,
+    CTRL | ALT_LEFT: 3,
+    CTRL | ALT_LEFT | SHIFT: 4,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def modifier_levels(modifiers):
+    # Levels selected by any of the space-separated modifier combinations, in
+    # which a modifier key followed by ? may or may not be pressed, in
+    # ascending order so that the caps lock level comes after level 1
+    levels = set()
+
+    for combination in modifiers.split() or ['']:
+        states = [0]
+        for key in filter(None, combination.split('+')):
+            bit = MODIFIERS.get(key.rstrip('?'))
+            if bit is None:
+                states = []
+                break
+            if key.endswith('?'):
+                states += [state | bit for state in states]
+            else:
+                states = [state | bit for state in states]
+        levels.update(LEVELS[state] for state in states if state in LEVELS)
+
+    return tuple(sorted(levels))
+
+
+class Key:
+    # The names of the four levels of a key, and the name of its caps lock
+    # level if it has one, as in the FOUR_LEVEL_PLUS_LOCK type
+    __slots__ = ('level1', 'level2', 'level3', 'level4', 'lock')
+
+    def __init__(self, level1='none', level2='none', level3='none',
+                 level4='none', lock=None):
+        self.level1 = level1
+        self.level2 = level2
+        self.level3 = level3
+        self.level4 = level4
+        self.lock = lock
+
+    def __iter__(self):
+        yield self.level1
+        yield self.level2
+        yield self.level3
+        yield self.level4
+        if self.lock is not None:
+            yield self.lock
+
+    def __eq__(self, other):
+        if not isinstance(other, Key):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot)
+            for slot in self.__slots__
+        )
+
+    def __repr__(self):
+        return f'Key{tuple(self)!r}'
+
+    @property
+    def type(self):
+        return 'FOUR_LEVEL_PLUS_LOCK' if self.lock is not None else None
+
+
+# The widths of the level columns are computed by render() when None, and
+# transforms are the (from, to) pairs of the simple transforms in order
+Layout = namedtuple(
+    'Layout', ['name', 'description', 'keys', 'widths', 'transforms'],
+    defaults=[None, ()]
+)
+
+
+def unescape(text):
+    return re.sub(
+        r'\\u\{([0-9A-Fa-f]+)\}', lambda m: chr(int(m[1], 16)), text
+    )
+
+
+def convert(source, name=None, description=None, label=None):
+    # Diagnostics are printed on stderr after label, by default the path of
+    # the source, so that those of batch conversions can be told apart
+    if label is None and isinstance(source, str):
+        label = source
+
+    def warn(*args):
+        if label:
+            args = (f'{label}:', *args)
+        print(*args, file=sys.stderr)
+
+    bmpnames = keysym.bmpnames
+    codetoname = keysym.codetoname
+
+    keys = {}
+
+    # Widths of the level columns, kept up to date as names are assigned,
+    # with the columns whose widest name was replaced by a shorter one
+    widths = [0] * 5
+    stale = set()
+
+    def assign(record, i, sym):
+        # Sets level i + 1 of a key to sym, keeping the widths up to date
+        slot = Key.__slots__[i]
+        if len(sym) >= widths[i]:
+            widths[i] = len(sym)
+        elif len(getattr(record, slot) or '') == widths[i]:
+            stale.add(i)
+        setattr(record, slot, sym)
+
+    layout_description = description
+    levels = []
+    unknown = set()
+    elems = []
+
+    # Characters of the levels that transforms apply to, by key and level
+    chars = {}
+    rules = []
+
+    # Time spent resolving maps while parsing, when phases are timed
+    profiling = timing.enabled
+    resolving = 0.0
+
+    # Stream the document, handling each element as it ends and then
+    # detaching it so that memory use does not grow with the file size
+    with timing.phase('parse'):
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                elems.append(elem)
+                if len(elems) != 2 or elem.tag != 'keyMap':
+                    continue
+                levels = modifier_levels(elem.attrib.get('modifiers', ''))
+                if not levels:
+                    warn('Unknown modifiers', elem.attrib['modifiers'].split())
+                continue
+
+            elems.pop()
+            if len(elems) != 2:
+                if elems:
+                    elems[-1].remove(elem)
+                continue
+            parent = elems[-1]
+            if parent.tag == 'keyMap' and elem.tag == 'map' and levels:
+                map = elem
+                key = KEY_NAMES.get(map.attrib['iso'])
+                if key is None:
+                    unknown.add(map.attrib['iso'])
+                    parent.remove(elem)
+                    continue
+                if profiling:
+                    start = time.perf_counter()
+                char = map.attrib['to']
+                code = (
+                    int(char[3:-1], 16) if char.startswith(r'\u')
+                    else ord(char)
+                )
+                sym = (
+                    bmpnames[code] if code < 0x10000
+                    else codetoname.get(code)
+                )
+                if sym is None:
+                    sym = f'U{code:04X}'
+                if key not in keys:
+                    if not keys:
+                        widths[:4] = [len('none')] * 4
+                    keys[key] = Key()
+                record = keys[key]
+                char = (
+                    chr(code) if map.attrib.get('transform') != 'no'
+                    else None
+                )
+                for level in levels:
+                    # A lock level like level 1, of this map or an earlier
+                    # one, is left out
+                    if level == 5 and record.level1 == sym:
+                        continue
+                    i = level - 1
+                    chars[key, i] = char
+                    assign(record, i, sym)
+                if profiling:
+                    resolving += time.perf_counter() - start
+            elif parent.tag == 'names' and elem.tag == 'name':
+                if not layout_description:
+                    layout_description = elem.attrib['value']
+            elif (parent.tag == 'transforms' and elem.tag == 'transform'
+                  and parent.attrib.get('type', 'simple') == 'simple'):
+                rules.append((
+                    unescape(elem.attrib['from']), unescape(elem.attrib['to'])
+                ))
+            parent.remove(elem)
+
+    # Characters that start longer transforms become dead keys, and the
+    # transforms are left to a compose table
+    with timing.phase('resolve'):
+        trie = transforms.build_trie(rules)
+        dead = transforms.dead_keys(trie)
+        for (key, i), char in chars.items():
+            if char in dead:
+                assign(keys[key], i, dead[char])
+    if profiling:
+        timing.move('parse', 'resolve', resolving)
+
+    shadowed = transforms.shadowed(trie)
+    if shadowed:
+        warn('Transforms shadowed by longer ones', shadowed)
+    undead = transforms.undead(trie)
+    if undead:
+        warn('Transforms without a dead key', undead)
+
+    if unknown:
+        warn('Unknown positions', sorted(unknown))
+
+    if not layout_description:
+        raise ValueError('no layout name found')
+
+    for i in stale:
+        slot = Key.__slots__[i]
+        widths[i] = max(
+            len(getattr(record, slot) or '') for record in keys.values()
+        )
+
+    if name:
+        layout_name = name
+    else:
+        layout_name = re.sub(r'[^a-z_]+', '_', layout_description.lower())
+
+    return Layout(
+        layout_name, layout_description, keys, tuple(widths), tuple(rules)
+    )
@@ -0,0 +1,123 @@
+import contextlib
+import errno
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+
+import keysym
+from ldml import ERRORS, convert, version
+from xkb import render
+
+# A request is a JSON header line with the converter version, the name and
+# description overrides and whether to align the levels, followed by the LDML
+# document up to the end of the stream. The response is a JSON header line
+# with the status and diagnostics, followed by the symbols when the status is
+# 'ok'.
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            header = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+
+        data = self.rfile.read()
+
+        if header.get('version') != self.server.version:
+            self.reply('version')
+            return
+
+        err = io.StringIO()
+        with contextlib.redirect_stderr(err):
+            try:
+                layout = convert(
+                    io.BytesIO(data),
+                    header.get('name'),
+                    header.get('description'),
+                    header.get('file'),
+                )
+                text = render(layout, header.get('align', True))
+            except ERRORS as e:
+                print(f'{header.get("file")}: {e!r}', file=sys.stderr)
+                self.reply('error', err.getvalue())
+                return
+
+        self.reply('ok', err.getvalue(), text)
+
+    def reply(self, status, errors='', text=''):
+        header = json.dumps({'status': status, 'errors': errors})
+        self.wfile.write(header.encode() + b'\n' + text.encode())
+
+
+def is_socket(path):
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def serve(path):
+    # Load everything up front so that the first request is as fast as the rest
+    keysym.load('codetoname')
+    keysym.load('bmpnames')
+
+    # Replace the socket of a server that is no longer running, but never
+    # anything else that is in the way
+    if os.path.lexists(path) and not is_socket(path):
+        raise FileExistsError(errno.EEXIST, 'Not a socket', path)
+    if is_socket(path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(path)
+            except ConnectionRefusedError:
+                os.unlink(path)
+
+    # Clean up the socket on termination too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit())
+
+    with socketserver.UnixStreamServer(path, Handler) as server:
+        server.version = version()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if is_socket(path):
+                os.unlink(path)
+
+
+def request(path, file, name=None, description=None, align=True):
+    # Returns the symbols (or None on failure) and the diagnostics, or None if
+    # no server of this version of the converter is listening on path
+    with open(file, 'rb') as f:
+        data = f.read()
+
+    header = json.dumps({
+        'version': version(),
+        'file': file,
+        'name': name,
+        'description': description,
+        'align': align,
+    })
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+            sock.sendall(header.encode() + b'\n' + data)
+            sock.shutdown(socket.SHUT_WR)
+            with sock.makefile('rb') as f:
+                response = json.loads(f.readline())
+                text = f.read().decode()
+        except (OSError, ValueError):
+            return None
+
+    if response['status'] == 'version':
+        return None
+
+    return text if response['status'] == 'ok' else None, response['errors']
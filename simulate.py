@@ -0,0 +1,80 @@
+import re
+
+import keysym
+import transforms
+from transforms import OUTPUT
+
+KEYSYM_U = re.compile(r'U([0-9A-F]{4,6})')
+
+
+def keysym_char(name, dead):
+    # The character typed by a keysym name of the keys table, if any, with
+    # the dead keysyms standing for the characters that start transforms
+    if name in dead:
+        return dead[name]
+    m = KEYSYM_U.fullmatch(name)
+    if m:
+        return chr(int(m[1], 16))
+    id = keysym.keysymnames.get(name)
+    keysym_code = None if id is None else keysym.keysym_class(
+        id, keysym.keysymtab
+    )
+    if keysym_code is None or not keysym_code[1]:
+        return None
+    return chr(keysym_code[1])
+
+
+class Simulator:
+    # Types (key, level) events on a converted layout as XKB would with its
+    # compose table: the characters of the levels go through the trie of the
+    # transforms that render_compose() writes, and the other characters are
+    # typed as they are. Levels are numbered as in ldml.LEVELS, with level 5
+    # the caps lock level.
+    def __init__(self, keys, rules=()):
+        self.trie = transforms.build_trie(
+            transforms.compose_rules(transforms.build_trie(rules))
+        )
+        starts = transforms.dead_keys(self.trie)
+        dead = {}
+        for char, name in starts.items():
+            dead.setdefault(name, char)
+
+        self.chars = {}
+        for key, record in keys.items():
+            levels = list(record)
+            if len(levels) == 4:
+                levels.append(levels[0])
+            for level, name in enumerate(levels, 1):
+                char = keysym_char(name, dead)
+                # Keys that type a dead key character as is had their map
+                # marked transform="no", and a tuple goes past the trie
+                if char in starts and name not in dead:
+                    char = (char,)
+                if char is not None:
+                    self.chars[key, level] = char
+
+    @classmethod
+    def from_layout(cls, layout):
+        return cls(layout.keys, layout.transforms)
+
+    def run(self, events):
+        # A sequence that goes off the trie is cancelled as compose does: its
+        # characters and the one that did not match are not typed, and one
+        # left unfinished after the events is not typed either
+        trie = self.trie
+        out = []
+        node = trie
+
+        for char in filter(None, map(self.chars.get, events)):
+            child = node.get(char)
+            if child is None:
+                if node is trie:
+                    out.append(char[0])
+                node = trie
+            elif OUTPUT in child:
+                out.append(child[OUTPUT])
+                node = trie
+            else:
+                node = child
+
+        return ''.join(out)
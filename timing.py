@@ -0,0 +1,88 @@
+import contextlib
+import json
+import sys
+import time
+
+# Whether phases are timed, and tracemalloc once memory is traced
+enabled = False
+tracemalloc = None
+
+# Totals of each phase in order of first use, as name: [depth, calls, seconds,
+# peak traced bytes]
+phases = {}
+
+# Peak traced bytes seen so far by each running phase
+running = []
+
+
+def enable(memory=True):
+    # Times the phases, and traces their peak memory unless memory is false,
+    # as tracing slows everything down
+    global enabled, tracemalloc
+    enabled = True
+    if memory:
+        import tracemalloc
+        tracemalloc.start()
+
+
+def add(name, seconds):
+    phases.setdefault(name, [len(running), 0, 0.0, None])
+    phases[name][1] += 1
+    phases[name][2] += seconds
+
+
+def move(source, name, seconds):
+    # Counts seconds timed in phase source, for work interleaved with it, in
+    # phase name instead
+    phases[source][2] -= seconds
+    phases[name][2] += seconds
+
+
+@contextlib.contextmanager
+def phase(name):
+    if not enabled:
+        yield
+        return
+
+    # Nested phases reset the peak, so keep the enclosing phase's one aside
+    if running and tracemalloc is not None:
+        running[-1] = max(running[-1], tracemalloc.get_traced_memory()[1])
+    add(name, 0.0)
+    running.append(0)
+    if tracemalloc is not None:
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name][2] += time.perf_counter() - start
+        peak = running.pop()
+        if tracemalloc is not None:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            if running:
+                running[-1] = max(running[-1], peak)
+            phases[name][3] = max(phases[name][3] or 0, peak)
+
+
+def report(format='text', file=sys.stderr):
+    if format == 'json':
+        json.dump([
+            {
+                'phase': name,
+                'depth': depth,
+                'calls': calls,
+                'seconds': seconds,
+                'peak_bytes': peak,
+            }
+            for name, (depth, calls, seconds, peak) in phases.items()
+        ], file, indent=2)
+        print(file=file)
+        return
+
+    print(f'{"phase":<24} {"calls":>6} {"time (ms)":>10} {"peak (KiB)":>11}',
+          file=file)
+    for name, (depth, calls, seconds, peak) in phases.items():
+        name = '  ' * depth + name
+        peak = '-' if peak is None else f'{peak / 1024:.0f}'
+        print(f'{name:<24} {calls:>6} {seconds * 1000:>10.2f} {peak:>11}',
+              file=file)
@@ -0,0 +1,123 @@
+# Key of the output of a complete sequence in the nodes of a trie, which
+# cannot clash with the characters that lead to the following nodes
+OUTPUT = ''
+
+# Dead keysyms standing for the characters that start transforms, in their
+# spacing and combining forms
+DEAD_KEYS = {
+    '`': 'dead_grave',
+    '\u0300': 'dead_grave',
+    '\u00b4': 'dead_acute',
+    '\u0384': 'dead_acute',
+    '\u0301': 'dead_acute',
+    '^': 'dead_circumflex',
+    '\u02c6': 'dead_circumflex',
+    '\u0302': 'dead_circumflex',
+    '~': 'dead_tilde',
+    '\u02dc': 'dead_tilde',
+    '\u0303': 'dead_tilde',
+    '\u00af': 'dead_macron',
+    '\u0304': 'dead_macron',
+    '\u02d8': 'dead_breve',
+    '\u0306': 'dead_breve',
+    '\u02d9': 'dead_abovedot',
+    '\u0307': 'dead_abovedot',
+    '\u00a8': 'dead_diaeresis',
+    '\u0308': 'dead_diaeresis',
+    '\u0309': 'dead_hook',
+    '\u02da': 'dead_abovering',
+    '\u030a': 'dead_abovering',
+    '\u02dd': 'dead_doubleacute',
+    '\u030b': 'dead_doubleacute',
+    '\u02c7': 'dead_caron',
+    '\u030c': 'dead_caron',
+    '\u030f': 'dead_doublegrave',
+    '\u0311': 'dead_invertedbreve',
+    '\u0313': 'dead_psili',
+    '\u0314': 'dead_dasia',
+    '\u031b': 'dead_horn',
+    '\u0323': 'dead_belowdot',
+    '\u0326': 'dead_belowcomma',
+    '\u00b8': 'dead_cedilla',
+    '\u0327': 'dead_cedilla',
+    '\u02db': 'dead_ogonek',
+    '\u0328': 'dead_ogonek',
+    '\u0345': 'dead_iota',
+    '\u037a': 'dead_iota',
+}
+
+
+def build_trie(rules):
+    # Nodes are dicts from characters to the following nodes, so a rule costs
+    # one step per character and sequences with a common prefix share nodes.
+    # Of several rules for the same sequence, the first one applies.
+    trie = {}
+
+    for sequence, output in rules:
+        if not sequence:
+            continue
+        node = trie
+        for char in sequence:
+            node = node.setdefault(char, {})
+        node.setdefault(OUTPUT, output)
+
+    return trie
+
+
+def dead_keys(trie):
+    # Dead keysyms of the characters that start longer sequences
+    return {
+        char: DEAD_KEYS[char]
+        for char, node in trie.items()
+        if char in DEAD_KEYS and len(node) > (OUTPUT in node)
+    }
+
+
+def children(node, depth):
+    # The stack entries of the nodes following node, first one on top
+    return [
+        (depth, char, child) for char, child in reversed(node.items())
+        if char != OUTPUT
+    ]
+
+
+def walk(trie):
+    # Yields the sequences of the trie that have an output with their node,
+    # grouped by prefix in the order in which the prefixes were first added.
+    # The path is shared, so this takes time linear in the size of the trie
+    # and of the sequences yielded.
+    path = []
+    stack = children(trie, 0)
+
+    while stack:
+        depth, char, node = stack.pop()
+        del path[depth:]
+        path.append(char)
+        if OUTPUT in node:
+            yield ''.join(path), node
+        stack.extend(children(node, depth + 1))
+
+
+def shadowed(trie):
+    # Sequences with an output of their own that are also the prefix of
+    # longer ones, which compose tables cannot express
+    return [sequence for sequence, node in walk(trie) if len(node) > 1]
+
+
+def undead(trie):
+    # Sequences that do not start with a dead key, which in a compose table
+    # would hold back every press of their first key
+    dead = dead_keys(trie)
+    return [
+        sequence for sequence, node in walk(trie) if sequence[0] not in dead
+    ]
+
+
+def compose_rules(trie):
+    # The rules that a compose table can express, which are those that start
+    # with a dead key and are not the prefix of longer ones
+    dead = dead_keys(trie)
+    return [
+        (sequence, node[OUTPUT]) for sequence, node in walk(trie)
+        if sequence[0] in dead and len(node) == 1
+    ]
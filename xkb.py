@@ -0,0 +1,75 @@
+import keysym
+import timing
+import transforms
+
+
+def column_widths(keys):
+    widths = [0] * 5
+    for key in keys.values():
+        for i, level in enumerate(key):
+            widths[i] = max(widths[i], len(level))
+    return tuple(widths)
+
+
+def render_row(key, widths):
+    n = [f'{level:>{widths[i]}}' for i, level in enumerate(key)]
+    row = f'[ {", ".join(n)} ]'
+    if key.type:
+        row += f', type[group1]="{key.type}" '
+    return row
+
+
+def render(layout, align=True, row=render_row):
+    if not align:
+        widths = (0,) * 5
+    elif layout.widths is None:
+        with timing.phase('widths'):
+            widths = column_widths(layout.keys)
+    else:
+        widths = layout.widths
+
+    with timing.phase('render'):
+        lines = [
+            'partial alphanumeric_keys',
+            f'xkb_symbols "{layout.name}" {{',
+            f'    name[Group1]= "{layout.description}";',
+            '',
+        ]
+        for name, key in layout.keys.items():
+            lines.append(f'    key <{name}> {{{row(key, widths)}}};')
+        lines += [
+            '',
+            '    include "level3(ralt_switch)"',
+            '};',
+        ]
+
+        return '\n'.join(lines) + '\n'
+
+
+def keysym_name(char):
+    code = ord(char)
+    if code < 0x10000:
+        sym = keysym.bmpnames[code]
+    else:
+        sym = keysym.codetoname.get(code)
+    return sym or f'U{code:04X}'
+
+
+def render_compose(layout):
+    # A compose table fragment with the transforms of the layout that start
+    # with one of its dead keys, one line per sequence
+    trie = transforms.build_trie(layout.transforms)
+    dead = transforms.dead_keys(trie)
+
+    lines = [f'# {layout.description}', '']
+    for sequence, output in transforms.compose_rules(trie):
+        events = ' '.join(
+            f'<{dead.get(char) or keysym_name(char)}>' for char in sequence
+        )
+        string = output.replace('\\', '\\\\').replace('"', '\\"')
+        line = f'{events} : "{string}"'
+        if len(output) == 1:
+            line += f' {keysym_name(output)}'
+        lines.append(line)
+
+    return '\n'.join(lines) + '\n'